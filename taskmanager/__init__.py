@@ -1 +1,9 @@
-from .task_manager import TaskManager
\ No newline at end of file
+__all__ = ['TaskManager', 'main']
+
+
+def __getattr__(name):
+    # Import task_manager on first use so `python -m taskmanager` can time it.
+    if name in __all__:
+        from . import task_manager
+        return getattr(task_manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,7 @@
+import time
+
+started = time.perf_counter()
+
+from .task_manager import main  # noqa: E402
+
+main(started=started, imported=time.perf_counter())
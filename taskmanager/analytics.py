@@ -0,0 +1,269 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; every function has a pure Python path.
+    np = None
+
+STATUSES = ('To be started', 'In progress', 'Finished')
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+UNKNOWN_STATUS = -1
+FINISHED = STATUS_CODES['Finished']
+NO_DUE_DATE = -1
+MIN_PRIORITY = 1
+MAX_PRIORITY = 10
+
+
+def parse_due_date(value):
+    """
+    Convert a due date string into a date ordinal.
+
+    Due dates are free text, so only the YYYY-MM-DD format is understood. Zero-padded
+    dates take the fast date.fromisoformat path; strptime is only used for dates such
+    as 2024-1-5.
+
+    Args:
+        value (str): The task's due date.
+
+    Returns:
+        int: The proleptic Gregorian ordinal, or NO_DUE_DATE if it cannot be parsed.
+    """
+    text = str(value).strip()
+    try:
+        if len(text) == 10 and text[4] == '-' and text[7] == '-':
+            return date.fromisoformat(text).toordinal()
+        if 8 <= len(text) < 10 and text[:1].isdigit():
+            return datetime.strptime(text, '%Y-%m-%d').toordinal()
+    except ValueError:
+        pass
+    return NO_DUE_DATE
+
+
+def _priority(task):
+    try:
+        return int(task.get('priority_level', 5))
+    except (TypeError, ValueError):
+        return 5
+
+
+def _today_ordinal(today):
+    return (today or date.today()).toordinal()
+
+
+def _is_vectorized(columns):
+    return np is not None and isinstance(columns['priority'], np.ndarray)
+
+
+def build_columns(tasks, use_numpy=None):
+    """
+    Build column arrays (priority, status code, due date ordinal) from task dictionaries.
+
+    Tasks without a status count as "To be started", matching the Kanban board.
+
+    Args:
+        tasks (list): A list of task dictionaries.
+        use_numpy (bool): Force NumPy on or off. Defaults to NumPy when it is installed.
+
+    Returns:
+        dict: Columns keyed by 'priority', 'status' and 'due'.
+    """
+    priority = [_priority(task) for task in tasks]
+    status = [STATUS_CODES.get(task.get('status', 'To be started'), UNKNOWN_STATUS) for task in tasks]
+    due = [parse_due_date(task.get('task_due_date', '')) for task in tasks]
+
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        if np is None:
+            raise ImportError("NumPy is not installed.")
+        return {
+            'priority': np.array(priority, dtype=np.int64),
+            'status': np.array(status, dtype=np.int64),
+            'due': np.array(due, dtype=np.int64),
+        }
+    return {'priority': priority, 'status': status, 'due': due}
+
+
+def priority_histogram(columns):
+    """
+    Count tasks at each priority level.
+
+    Args:
+        columns (dict): Columns returned by build_columns.
+
+    Returns:
+        list: Counts for priority levels 1 to 10, in order.
+    """
+    if _is_vectorized(columns):
+        priority = columns['priority']
+        valid = priority[(priority >= MIN_PRIORITY) & (priority <= MAX_PRIORITY)]
+        return np.bincount(valid, minlength=MAX_PRIORITY + 1)[MIN_PRIORITY:].tolist()
+
+    counts = [0] * (MAX_PRIORITY - MIN_PRIORITY + 1)
+    for priority in columns['priority']:
+        if MIN_PRIORITY <= priority <= MAX_PRIORITY:
+            counts[priority - MIN_PRIORITY] += 1
+    return counts
+
+
+def status_counts(columns):
+    """
+    Count tasks with each status, whatever their priority.
+
+    Args:
+        columns (dict): Columns returned by build_columns.
+
+    Returns:
+        dict: Maps each status name to its number of tasks.
+    """
+    if _is_vectorized(columns):
+        status = columns['status']
+        counts = np.bincount(status[status >= 0], minlength=len(STATUSES)).tolist()
+    else:
+        counter = Counter(columns['status'])
+        counts = [counter[code] for code in range(len(STATUSES))]
+    return {name: counts[code] for code, name in enumerate(STATUSES)}
+
+
+def priority_distribution_by_status(columns):
+    """
+    Count tasks at each priority level, separately for every status.
+
+    Args:
+        columns (dict): Columns returned by build_columns.
+
+    Returns:
+        dict: Maps each status name to a list of counts for priority levels 1 to 10.
+    """
+    width = MAX_PRIORITY - MIN_PRIORITY + 1
+    if _is_vectorized(columns):
+        priority, status = columns['priority'], columns['status']
+        valid = (status >= 0) & (priority >= MIN_PRIORITY) & (priority <= MAX_PRIORITY)
+        cells = status[valid] * width + (priority[valid] - MIN_PRIORITY)
+        grid = np.bincount(cells, minlength=len(STATUSES) * width).reshape(len(STATUSES), width)
+        return {name: grid[code].tolist() for code, name in enumerate(STATUSES)}
+
+    grid = [[0] * width for _ in STATUSES]
+    for priority, status in zip(columns['priority'], columns['status']):
+        if status >= 0 and MIN_PRIORITY <= priority <= MAX_PRIORITY:
+            grid[status][priority - MIN_PRIORITY] += 1
+    return {name: grid[code] for code, name in enumerate(STATUSES)}
+
+
+def overdue_count(columns, today=None):
+    """
+    Count unfinished tasks whose due date is before today.
+
+    Args:
+        columns (dict): Columns returned by build_columns.
+        today (date): The reference date. Defaults to the current date.
+
+    Returns:
+        int: The number of overdue tasks.
+    """
+    cutoff = _today_ordinal(today)
+    if _is_vectorized(columns):
+        due = columns['due']
+        overdue = (columns['status'] != FINISHED) & (due != NO_DUE_DATE) & (due < cutoff)
+        return int(np.count_nonzero(overdue))
+
+    return sum(
+        1 for status, due in zip(columns['status'], columns['due'])
+        if status != FINISHED and due != NO_DUE_DATE and due < cutoff
+    )
+
+
+def burndown(columns, start=None, days=14):
+    """
+    Build a planned burn-down series from the due dates of unfinished tasks.
+
+    The remaining count for a day is the number of unfinished, dated tasks that are
+    due after that day, i.e. the work left if every task is done on its due date.
+
+    Args:
+        columns (dict): Columns returned by build_columns.
+        start (date): The first day of the series. Defaults to the current date.
+        days (int): The number of days in the series.
+
+    Returns:
+        list: (date, remaining) tuples, one per day.
+    """
+    start = start or date.today()
+    if days <= 0:
+        return []
+    first = start.toordinal()
+
+    if _is_vectorized(columns):
+        due = columns['due']
+        open_due = np.sort(due[(columns['status'] != FINISHED) & (due != NO_DUE_DATE)])
+        day_ordinals = np.arange(first, first + days)
+        remaining = len(open_due) - np.searchsorted(open_due, day_ordinals, side='right')
+        return [(start + timedelta(days=offset), int(count)) for offset, count in enumerate(remaining)]
+
+    # Bucket due dates inside the window and sweep once, so the cost is O(n + days).
+    last = first + days - 1
+    remaining = 0
+    due_in_window = [0] * days
+    for status, due in zip(columns['status'], columns['due']):
+        if status == FINISHED or due == NO_DUE_DATE:
+            continue
+        if due > last:
+            remaining += 1
+        elif due >= first:
+            remaining += 1
+            due_in_window[due - first] += 1
+
+    series = []
+    for offset in range(days):
+        remaining -= due_in_window[offset]
+        series.append((start + timedelta(days=offset), remaining))
+    return series
+
+
+def summarize(tasks, today=None, use_numpy=None):
+    """
+    Compute summary statistics for a list of tasks.
+
+    Args:
+        tasks (list): A list of task dictionaries.
+        today (date): The reference date for overdue tasks. Defaults to the current date.
+        use_numpy (bool): Force NumPy on or off. Defaults to NumPy when it is installed.
+
+    Returns:
+        dict: Totals, per-status counts, overdue and high priority counts, and the priority histogram.
+    """
+    columns = build_columns(tasks, use_numpy=use_numpy)
+    by_status = priority_distribution_by_status(columns)
+    counts = status_counts(columns)
+    open_high_priority = sum(
+        levels[level - MIN_PRIORITY]
+        for status, levels in by_status.items() if status != 'Finished'
+        for level in range(8, MAX_PRIORITY + 1)
+    )
+    return {
+        'total': len(tasks),
+        'completed': counts['Finished'],
+        'open': len(tasks) - counts['Finished'],
+        'by_status': counts,
+        'overdue': overdue_count(columns, today=today),
+        'high_priority_open': open_high_priority,
+        'priority_histogram': priority_histogram(columns),
+    }
+
+
+def format_summary(summary):
+    """
+    Format a summary from summarize() as a one-line header.
+
+    Args:
+        summary (dict): The summary statistics.
+
+    Returns:
+        str: The header text.
+    """
+    return (
+        f"Tasks: {summary['total']} | Open: {summary['open']} | "
+        f"Completed: {summary['completed']} | Overdue: {summary['overdue']} | "
+        f"High priority open: {summary['high_priority_open']}"
+    )
@@ -0,0 +1,207 @@
+import json
+import os
+import time
+
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+
+
+def event_from_record(record, reverse=False):
+    """
+    Describe an applied or reverted history record as a change event.
+
+    Args:
+        record (dict): A record created by TaskHistory.
+        reverse (bool): Whether the record was reverted (undone) instead of applied.
+
+    Returns:
+        tuple: (event_type, index, before, after). For updates, before and after hold
+            only the changed fields; for creations and deletions, the whole task.
+    """
+    index = record['index']
+    if record['action'] == 'edit':
+        if reverse:
+            return UPDATED, index, dict(record['after']), dict(record['before'])
+        return UPDATED, index, dict(record['before']), dict(record['after'])
+    if (record['action'] == 'add') != reverse:
+        return CREATED, index, None, dict(record['task'])
+    return DELETED, index, dict(record['task']), None
+
+
+def _last_sequence(path):
+    """Return the sequence number of the last complete event in an NDJSON change log."""
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        position = file.tell()
+        data = b''
+        # Read backwards until at least one whole line is in the buffer.
+        while position > 0 and data.count(b'\n') < 2:
+            step = min(4096, position)
+            position -= step
+            file.seek(position)
+            data = file.read(step) + data
+    # The text after the last newline is a partial write; the first line may be cut off.
+    lines = data.split(b'\n')[:-1]
+    if position > 0:
+        lines = lines[1:]
+    for line in reversed(lines):
+        try:
+            return json.loads(line)['seq']
+        except (ValueError, KeyError):
+            continue
+    return 0
+
+
+def _cut_partial_line(path):
+    """Remove an unfinished last line left by an interrupted write from an NDJSON file."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r+b') as file:
+        file.seek(0, os.SEEK_END)
+        end = position = file.tell()
+        if not end:
+            return
+        file.seek(end - 1)
+        if file.read(1) == b'\n':
+            return
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            file.seek(position)
+            newline = file.read(step).rfind(b'\n')
+            if newline >= 0:
+                file.truncate(position + newline + 1)
+                return
+        file.truncate(0)
+
+
+class ChangeFeed:
+    """
+    Sequenced stream of task changes.
+
+    Every event is a dictionary {'seq', 'type', 'index', 'before', 'after', 'timestamp'}
+    where 'type' is 'created', 'updated' or 'deleted' and 'index' is the task's position
+    in the list. Events are passed to in-process subscribers and, if a path is given,
+    appended to that file as newline-delimited JSON. Sequence numbers continue from the
+    last event already in the file. An unfinished last line left by an interrupted write
+    is removed before new events are appended. A change log should have a single
+    writing process.
+    Exceptions raised by subscribers are reported and do not stop other subscribers.
+    """
+
+    def __init__(self, path=None):
+        """Initialize the feed, optionally appending events to the NDJSON file at path."""
+        self.path = path
+        self.subscribers = []
+        self.sequence = _last_sequence(path) if path else 0
+
+    def subscribe(self, callback):
+        """Call callback(event) for every future event."""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop sending events to callback."""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    @property
+    def active(self):
+        """Whether anyone consumes the events."""
+        return bool(self.subscribers or self.path)
+
+    def publish(self, changes):
+        """
+        Publish one or more changes as events.
+
+        Args:
+            changes (list): (event_type, index, before, after) tuples, in order.
+
+        Returns:
+            list: The published events.
+        """
+        timestamp = time.time()
+        events = []
+        for event_type, index, before, after in changes:
+            self.sequence += 1
+            events.append({
+                'seq': self.sequence,
+                'type': event_type,
+                'index': index,
+                'before': before,
+                'after': after,
+                'timestamp': timestamp
+            })
+        if not events:
+            return events
+
+        if self.path:
+            try:
+                _cut_partial_line(self.path)
+                with open(self.path, 'a') as file:
+                    file.write(''.join(json.dumps(event) + '\n' for event in events))
+            except OSError as e:
+                print(f"Error writing change log: {e}")
+        for event in events:
+            for callback in list(self.subscribers):
+                # One failing subscriber must not stop the others or the caller.
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Error in change feed subscriber: {e}")
+        return events
+
+
+def read_events(path, offset=0):
+    """
+    Read events from an NDJSON change log, starting at a byte offset.
+
+    A partially written last line is left for the next read. Complete lines that are
+    not valid JSON are reported and skipped.
+
+    Args:
+        path (str): The change log file.
+        offset (int): The byte offset to start from, e.g. the offset returned with the
+            last event already processed.
+
+    Yields:
+        tuple: (event, next_offset), where next_offset is where to resume after this event.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        while True:
+            line = file.readline()
+            if not line.endswith(b'\n'):
+                return
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                print(f"Skipping unreadable change log line ending at byte {offset}.")
+                continue
+            yield event, offset
+
+
+def follow_events(path, offset=0, poll_interval=0.5, stop=None):
+    """
+    Tail an NDJSON change log, yielding events as they are appended.
+
+    Args:
+        path (str): The change log file.
+        offset (int): The byte offset to start from.
+        poll_interval (float): Seconds to wait before checking the file again.
+        stop (callable): Called between polls; following ends once it returns True.
+
+    Yields:
+        tuple: (event, next_offset), as read_events.
+    """
+    while stop is None or not stop():
+        for event, offset in read_events(path, offset):
+            yield event, offset
+        time.sleep(poll_interval)
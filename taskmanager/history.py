@@ -0,0 +1,212 @@
+def diff_fields(before, after):
+    """
+    Compare two versions of a task.
+
+    Args:
+        before (dict): The task before the change.
+        after (dict): The task after the change.
+
+    Returns:
+        tuple: (old_values, new_values) containing only the fields that changed.
+            Fields missing from a version are left out of its dictionary.
+    """
+    old_values, new_values = {}, {}
+    for key in before.keys() | after.keys():
+        if key in before and key in after and before[key] == after[key]:
+            continue
+        if key in before:
+            old_values[key] = before[key]
+        if key in after:
+            new_values[key] = after[key]
+    return old_values, new_values
+
+
+def _set_fields(task, old_values, new_values):
+    for key in old_values.keys() - new_values.keys():
+        task.pop(key, None)
+    task.update(new_values)
+
+
+class TaskHistory:
+    """
+    Undo/redo history of task changes, stored as diff records.
+
+    Each record describes one change instead of copying the task list:
+    {'action': 'add' | 'delete', 'index': int, 'task': dict} or
+    {'action': 'edit', 'index': int, 'before': dict, 'after': dict}, where an edit
+    keeps only the fields that changed. Memory therefore grows with the size of the
+    changes, not with the number of tasks.
+
+    Versions are numbered from 0, one per change. A named snapshot remembers a
+    version and can be restored by undoing or redoing up to it.
+    """
+
+    def __init__(self, max_steps=10000):
+        """Initialize an empty history keeping at most max_steps records."""
+        self.max_steps = max_steps
+        self.records = []
+        self.base_version = 0   # Version before records[0] was applied
+        self.position = 0       # Number of records currently applied
+        self.snapshots = {}
+
+    @property
+    def version(self):
+        """The version of the task list at the current position."""
+        return self.base_version + self.position
+
+    def can_undo(self):
+        return self.position > 0
+
+    def can_redo(self):
+        return self.position < len(self.records)
+
+    def record_add(self, index, task):
+        """Record that task was inserted at index and return the record."""
+        return self._record({'action': 'add', 'index': index, 'task': task})
+
+    def record_delete(self, index, task):
+        """Record that task was removed from index and return the record."""
+        return self._record({'action': 'delete', 'index': index, 'task': task})
+
+    def record_edit(self, index, before, after):
+        """
+        Record that the task at index changed from before to after and return the record.
+
+        No-op edits are not recorded and return None.
+        """
+        old_values, new_values = diff_fields(before, after)
+        if old_values or new_values:
+            return self._record({'action': 'edit', 'index': index, 'before': old_values, 'after': new_values})
+
+    def _record(self, record):
+        # A new change discards the redo history and any snapshots taken inside it.
+        if self.can_redo():
+            del self.records[self.position:]
+            self.snapshots = {
+                name: version for name, version in self.snapshots.items() if version <= self.version
+            }
+        self.records.append(record)
+        self.position += 1
+        if self.max_steps is not None and len(self.records) > self.max_steps:
+            dropped = len(self.records) - self.max_steps
+            del self.records[:dropped]
+            self.base_version += dropped
+            self.position -= dropped
+            self.snapshots = {
+                name: version for name, version in self.snapshots.items() if version >= self.base_version
+            }
+        return record
+
+    def undo(self, tasks):
+        """
+        Revert the most recent change in tasks.
+
+        Args:
+            tasks (list): The task list to modify in place.
+
+        Returns:
+            dict: The reverted record, or None if there is nothing to undo.
+        """
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        record = self.records[self.position]
+        apply_record(tasks, record, reverse=True)
+        return record
+
+    def redo(self, tasks):
+        """
+        Re-apply the most recently undone change to tasks.
+
+        Args:
+            tasks (list): The task list to modify in place.
+
+        Returns:
+            dict: The re-applied record, or None if there is nothing to redo.
+        """
+        if not self.can_redo():
+            return None
+        record = self.records[self.position]
+        apply_record(tasks, record)
+        self.position += 1
+        return record
+
+    def save_snapshot(self, name):
+        """Remember the current version under name."""
+        self.snapshots[name] = self.version
+
+    def restore_snapshot(self, name, tasks, on_step=None):
+        """
+        Undo or redo changes in tasks until it matches the named snapshot.
+
+        Args:
+            name (str): The snapshot name.
+            tasks (list): The task list to modify in place.
+            on_step (callable): Called as on_step(record, reverse) right after each step,
+                while tasks still reflects that step.
+
+        Returns:
+            list: (record, reverse) pairs for every step applied, in order.
+
+        Raises:
+            KeyError: If there is no snapshot with that name.
+        """
+        target = self.snapshots[name]
+        steps = []
+        while self.version != target:
+            reverse = self.version > target
+            record = self.undo(tasks) if reverse else self.redo(tasks)
+            steps.append((record, reverse))
+            if on_step is not None:
+                on_step(record, reverse)
+        return steps
+
+    def tasks_at(self, name, tasks):
+        """
+        Rebuild the task list as it was at the named snapshot without changing tasks.
+
+        Args:
+            name (str): The snapshot name.
+            tasks (list): The current task list.
+
+        Returns:
+            list: A new task list. Tasks unchanged since the snapshot are shared, not copied.
+
+        Raises:
+            KeyError: If there is no snapshot with that name.
+        """
+        target = self.snapshots[name] - self.base_version
+        view = list(tasks)
+        # Edited tasks are copied before the change is replayed on them.
+        copied = set()
+        if target < self.position:
+            steps = [(record, True) for record in reversed(self.records[target:self.position])]
+        else:
+            steps = [(record, False) for record in self.records[self.position:target]]
+        for record, reverse in steps:
+            if record['action'] == 'edit' and id(view[record['index']]) not in copied:
+                view[record['index']] = dict(view[record['index']])
+                copied.add(id(view[record['index']]))
+            apply_record(view, record, reverse=reverse)
+        return view
+
+
+def apply_record(tasks, record, reverse=False):
+    """
+    Apply a history record to a task list, or revert it when reverse is True.
+
+    Args:
+        tasks (list): The task list to modify in place.
+        record (dict): A record created by TaskHistory.
+        reverse (bool): Whether to revert the change instead of applying it.
+    """
+    action, index = record['action'], record['index']
+    if action == 'edit':
+        if reverse:
+            _set_fields(tasks[index], record['after'], record['before'])
+        else:
+            _set_fields(tasks[index], record['before'], record['after'])
+    elif (action == 'add') != reverse:
+        tasks.insert(index, record['task'])
+    else:
+        tasks.pop(index)
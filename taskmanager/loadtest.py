@@ -0,0 +1,499 @@
+"""
+Load-testing harness for the Task Manager.
+
+Replays scripted menu sessions through TaskManager.handle_menu_choice in several
+processes that share one task file, and reports throughput, latency percentiles and
+lost updates. Sessions are either generated from an operation mix or loaded from a
+JSON file of recorded sessions:
+
+    [[{"choice": "1", "inputs": ["Task", "2024-01-01", "", "5", "1"]}, ...], ...]
+
+Each session uses its own TaskManager, like one run of the application. Run it with
+
+    python -m taskmanager.loadtest --file loadtest_tasks.json --workers 4 --seed-tasks 1000
+"""
+import argparse
+import builtins
+import io
+import json
+import math
+import os
+import random
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+from .task_manager import TaskManager
+
+MENU_CHOICES = {
+    'add': '1',
+    'kanban': '2',
+    'edit': '3',
+    'delete': '4',
+    'search': '5',
+    'filter': '6'
+}
+CHOICE_OPERATIONS = {choice: operation for operation, choice in MENU_CHOICES.items()}
+DEFAULT_MIX = {'add': 3, 'edit': 2, 'delete': 1, 'search': 2, 'filter': 1, 'kanban': 1}
+CORRUPT_FILE_MESSAGE = "Error: Task file is corrupted."
+WORDS = ('report', 'meeting', 'review', 'deploy', 'invoice', 'design', 'plan', 'email')
+
+
+class SessionInputError(Exception):
+    """Raised when a scripted step asks for more input than it provides."""
+
+
+def parse_mix(text):
+    """
+    Parse an operation mix such as 'add=3,edit=2,search=1'.
+
+    Args:
+        text (str): Comma-separated operation=weight pairs.
+
+    Returns:
+        dict: Maps operation names to weights.
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is not a non-negative integer.
+    """
+    mix = {}
+    for part in text.split(','):
+        operation, _, weight = part.partition('=')
+        operation = operation.strip()
+        if operation not in MENU_CHOICES:
+            raise ValueError(f"Unknown operation '{operation}'.")
+        mix[operation] = int(weight)
+        if mix[operation] < 0:
+            raise ValueError(f"Weight for '{operation}' must not be negative.")
+    if not any(mix.values()):
+        raise ValueError("At least one operation needs a positive weight.")
+    return mix
+
+
+def make_task(name, rng):
+    """Return a task dictionary with random details."""
+    return {
+        "task_name": name,
+        "task_due_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "task_description": f"{rng.choice(WORDS)} {rng.choice(WORDS)}",
+        "priority_level": rng.randint(1, 10),
+        "status": rng.choice(('To be started', 'In progress', 'Finished'))
+    }
+
+
+def seed_task_file(task_file, count, seed=0):
+    """Overwrite task_file with count generated tasks."""
+    rng = random.Random(seed)
+    with open(task_file, 'w') as file:
+        json.dump([make_task(f"seed-{number}", rng) for number in range(count)], file)
+
+
+def synthetic_step(operation, task_manager, rng, name):
+    """
+    Build the menu choice and inputs for one operation against the current tasks.
+
+    Edits and deletes fall back to adding a task when there are no tasks.
+
+    Args:
+        operation (str): One of the keys of MENU_CHOICES.
+        task_manager (TaskManager): The session's task manager.
+        rng (random.Random): The random number generator.
+        name (str): A unique task name for adds and renames.
+
+    Returns:
+        dict: {'choice': str, 'inputs': list}.
+    """
+    task_count = len(task_manager.tasks)
+    if operation in ('edit', 'delete') and not task_count:
+        operation = 'add'
+
+    if operation == 'add':
+        task = make_task(name, rng)
+        status = str(rng.randint(1, 3))
+        inputs = [name, task['task_due_date'], task['task_description'], str(task['priority_level']), status]
+    elif operation == 'edit':
+        number = str(rng.randint(1, task_count))
+        inputs = [number, name, '', '', str(rng.randint(1, 10)), str(rng.randint(1, 3))]
+    elif operation == 'delete':
+        inputs = [str(rng.randint(1, task_count))]
+    elif operation == 'search':
+        inputs = [rng.choice(WORDS), 'q']
+    elif operation == 'filter':
+        filter_choice = rng.choice(('1', '2', '3'))
+        if filter_choice == '1':
+            value = str(rng.randint(1, 3))
+        elif filter_choice == '2':
+            value = str(rng.randint(1, 10))
+        else:
+            value = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        inputs = [filter_choice, value, 'q']
+    else:
+        inputs = []
+    return {'choice': MENU_CHOICES[operation], 'inputs': inputs}
+
+
+def run_step(task_manager, step):
+    """
+    Run one menu choice with scripted input and captured output.
+
+    Args:
+        task_manager (TaskManager): The session's task manager.
+        step (dict): {'choice': str, 'inputs': list}.
+
+    Returns:
+        tuple: (elapsed_seconds, output).
+
+    Raises:
+        SessionInputError: If the step needs more input than it provides.
+    """
+    inputs = iter(step['inputs'])
+
+    def scripted_input(prompt=''):
+        try:
+            return next(inputs)
+        except StopIteration:
+            raise SessionInputError(f"Choice {step['choice']!r} ran out of input at prompt {prompt!r}.")
+
+    output = io.StringIO()
+    original_input = builtins.input
+    builtins.input = scripted_input
+    try:
+        with redirect_stdout(output):
+            started = time.perf_counter()
+            task_manager.handle_menu_choice(step['choice'])
+            elapsed = time.perf_counter() - started
+    finally:
+        builtins.input = original_input
+    return elapsed, output.getvalue()
+
+
+def _track_changes(task_manager, names_added, names_removed, field_edits, removed_at):
+    """
+    Return a change feed subscriber recording what a session changed.
+
+    An add adds its name, a delete removes its name, and a rename removes the old
+    name and adds the new one. Every other edited field is stored in field_edits as
+    (name, field) -> (timestamp, value), keeping the latest edit, and removed_at keeps
+    the time each name was last deleted or renamed away.
+    """
+    def on_event(event):
+        before, after = event['before'] or {}, event['after'] or {}
+        before_name, after_name = before.get('task_name'), after.get('task_name')
+        timestamp = event['timestamp']
+        if event['type'] == 'updated' and after_name is None:
+            # The name did not change, so look it up in the saved list.
+            try:
+                after_name = task_manager.tasks[event['index']].get('task_name')
+            except IndexError:
+                return
+        else:
+            if before_name is not None:
+                names_removed[before_name] += 1
+                removed_at[before_name] = max(removed_at.get(before_name, timestamp), timestamp)
+            if after_name is not None:
+                names_added[after_name] += 1
+        if event['type'] != 'updated':
+            return
+        for field, value in after.items():
+            key = (after_name, field)
+            if field != 'task_name' and (key not in field_edits or field_edits[key][0] <= timestamp):
+                field_edits[key] = (timestamp, value)
+    return on_event
+
+
+def count_lost_updates(initial_names, names_added, names_removed, final_names):
+    """
+    Compare the task names expected after a run with the names actually saved.
+
+    Sessions that deleted or renamed the same task from stale copies remove a name
+    more often than it existed. Those extra removals are conflicting removals: they
+    are counted separately and do not make the expected count negative.
+
+    Args:
+        initial_names (Counter): Task names in the file before the run.
+        names_added (Counter): Names added by all sessions.
+        names_removed (Counter): Names removed by all sessions.
+        final_names (Counter): Task names in the file after the run.
+
+    Returns:
+        tuple: (lost_updates, conflicting_removals). lost_updates counts expected
+            names missing from the file plus names the file has but should not,
+            such as a deleted task written back by a stale save.
+    """
+    lost_updates = 0
+    conflicting_removals = 0
+    for name in set(initial_names) | set(names_added) | set(names_removed) | set(final_names):
+        available = initial_names.get(name, 0) + names_added.get(name, 0)
+        removed = names_removed.get(name, 0)
+        conflicting_removals += max(removed - available, 0)
+        expected = max(available - removed, 0)
+        lost_updates += abs(final_names.get(name, 0) - expected)
+    return lost_updates, conflicting_removals
+
+
+def count_lost_edits(field_edits, removed_at, final_tasks):
+    """
+    Count field edits that a later save overwrote without changing them again.
+
+    Only the latest edit of each field is checked, and only while its task still
+    has the same name: deleted, renamed and missing tasks are left to
+    count_lost_updates.
+
+    Args:
+        field_edits (dict): (name, field) -> (timestamp, value) of the latest edits.
+        removed_at (dict): Name -> time the name was last deleted or renamed away.
+        final_tasks (list): The tasks in the file after the run.
+
+    Returns:
+        int: The number of edited fields whose value is missing from the file.
+    """
+    tasks_by_name = defaultdict(list)
+    for task in final_tasks:
+        tasks_by_name[task.get('task_name')].append(task)
+    lost_edits = 0
+    for (name, field), (timestamp, value) in field_edits.items():
+        if name not in tasks_by_name or timestamp <= removed_at.get(name, float('-inf')):
+            continue
+        if all(task.get(field) != value for task in tasks_by_name[name]):
+            lost_edits += 1
+    return lost_edits
+
+
+def run_worker(task_file, worker_id, sessions=None, session_count=10, steps_per_session=5,
+               mix=None, seed=0, page_size=10):
+    """
+    Run sessions in one process.
+
+    Args:
+        task_file (str): The shared task file.
+        worker_id (int): Used to make task names unique across workers.
+        sessions (list): Recorded sessions to replay. If None, sessions are generated.
+        session_count (int): The number of generated sessions.
+        steps_per_session (int): The number of steps in each generated session.
+        mix (dict): Operation weights for generated sessions. Defaults to DEFAULT_MIX.
+        seed (int): Random seed for generated sessions.
+        page_size (int): The TaskManager page size.
+
+    Returns:
+        dict: Latencies per operation (plus 'load' for reading the task file), names
+            added and removed and field edits as seen through the change feed, error
+            and corrupt read counts, and the sessions that were run.
+    """
+    rng = random.Random(seed * 1000003 + worker_id)
+    mix = mix or DEFAULT_MIX
+    operations, weights = zip(*mix.items())
+    latencies = defaultdict(list)
+    names_added = Counter()
+    names_removed = Counter()
+    field_edits = {}
+    removed_at = {}
+    errors = []
+    corrupt_reads = 0
+    ran_sessions = []
+    generated_names = 0
+
+    session_iter = iter(sessions) if sessions is not None else (None for _ in range(session_count))
+    for session in session_iter:
+        task_manager = TaskManager(task_file=task_file, page_size=page_size)
+        task_manager.change_feed.subscribe(
+            _track_changes(task_manager, names_added, names_removed, field_edits, removed_at)
+        )
+        # Time reading the shared file separately from the menu operations.
+        output = io.StringIO()
+        with redirect_stdout(output):
+            started = time.perf_counter()
+            task_manager.tasks
+            latencies['load'].append(time.perf_counter() - started)
+        corrupt_reads += output.getvalue().count(CORRUPT_FILE_MESSAGE)
+        steps = session if session is not None else [None] * steps_per_session
+        ran_steps = []
+        for step in steps:
+            if step is None:
+                generated_names += 1
+                operation = rng.choices(operations, weights)[0]
+                step = synthetic_step(operation, task_manager, rng, f"load-{worker_id}-{generated_names}")
+            operation = CHOICE_OPERATIONS.get(step['choice'], 'other')
+            try:
+                elapsed, output = run_step(task_manager, step)
+            except Exception as e:
+                errors.append(f"{operation}: {type(e).__name__}: {e}")
+                continue
+            latencies[operation].append(elapsed)
+            corrupt_reads += output.count(CORRUPT_FILE_MESSAGE)
+            ran_steps.append(step)
+        ran_sessions.append(ran_steps)
+
+    return {
+        'latencies': dict(latencies),
+        'names_added': dict(names_added),
+        'names_removed': dict(names_removed),
+        'field_edits': field_edits,
+        'removed_at': removed_at,
+        'errors': errors,
+        'corrupt_reads': corrupt_reads,
+        'sessions': ran_sessions
+    }
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a sorted, non-empty list."""
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def _read_tasks(task_file):
+    try:
+        with open(task_file) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return []
+
+
+def run_load_test(task_file, workers=4, sessions=None, session_count=10, steps_per_session=5,
+                  mix=None, seed=0, page_size=10):
+    """
+    Run sessions concurrently in worker processes against one task file.
+
+    Recorded sessions are dealt out to workers round-robin; otherwise every worker
+    generates session_count sessions.
+
+    Lost updates are changes a session made that are missing from the final task file,
+    such as an added task overwritten by another process's save or a deleted task that
+    comes back, or an edited priority that a stale save put back. They are counted by
+    comparing the task names and the latest field edits seen in all change events with
+    the file after the run, see count_lost_updates and count_lost_edits.
+
+    Returns:
+        dict: The report, see format_report.
+    """
+    initial_names = Counter(task.get('task_name') for task in _read_tasks(task_file))
+    if sessions is not None:
+        shares = [sessions[worker::workers] for worker in range(workers)]
+    else:
+        shares = [None] * workers
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_worker, task_file, worker, shares[worker], session_count,
+                            steps_per_session, mix, seed, page_size)
+            for worker in range(workers)
+        ]
+        results = [future.result() for future in futures]
+    duration = time.perf_counter() - started
+
+    latencies = defaultdict(list)
+    names_added = Counter()
+    names_removed = Counter()
+    field_edits = {}
+    removed_at = {}
+    for result in results:
+        for operation, values in result['latencies'].items():
+            latencies[operation].extend(values)
+        names_added.update(result['names_added'])
+        names_removed.update(result['names_removed'])
+        for key, edit in result['field_edits'].items():
+            if key not in field_edits or field_edits[key][0] <= edit[0]:
+                field_edits[key] = edit
+        for name, timestamp in result['removed_at'].items():
+            removed_at[name] = max(removed_at.get(name, timestamp), timestamp)
+    final_tasks = _read_tasks(task_file)
+    lost_updates, conflicting_removals = count_lost_updates(
+        initial_names, names_added, names_removed, Counter(task.get('task_name') for task in final_tasks)
+    )
+    lost_edits = count_lost_edits(field_edits, removed_at, final_tasks)
+
+    all_latencies = sorted(
+        value for operation, values in latencies.items() if operation != 'load' for value in values
+    )
+    operation_stats = {}
+    for operation, values in sorted(latencies.items()):
+        values.sort()
+        operation_stats[operation] = {
+            'count': len(values),
+            'p50_ms': percentile(values, 0.50) * 1000,
+            'p95_ms': percentile(values, 0.95) * 1000,
+            'p99_ms': percentile(values, 0.99) * 1000,
+            'max_ms': values[-1] * 1000
+        }
+    return {
+        'workers': workers,
+        'operations': len(all_latencies),
+        'duration_s': duration,
+        'throughput_ops': len(all_latencies) / duration if duration else 0.0,
+        'p50_ms': percentile(all_latencies, 0.50) * 1000 if all_latencies else 0.0,
+        'p99_ms': percentile(all_latencies, 0.99) * 1000 if all_latencies else 0.0,
+        'by_operation': operation_stats,
+        'errors': [error for result in results for error in result['errors']],
+        'corrupt_reads': sum(result['corrupt_reads'] for result in results),
+        'lost_updates': lost_updates + lost_edits,
+        'lost_edits': lost_edits,
+        'conflicting_removals': conflicting_removals,
+        'sessions': [session for result in results for session in result['sessions']]
+    }
+
+
+def format_report(report):
+    """
+    Format a load test report as text.
+
+    Args:
+        report (dict): The report returned by run_load_test.
+
+    Returns:
+        str: The report text.
+    """
+    lines = [
+        f"Workers: {report['workers']}  Operations: {report['operations']}  "
+        f"Duration: {report['duration_s']:.2f} s  Throughput: {report['throughput_ops']:.1f} ops/s",
+        f"Latency: p50 {report['p50_ms']:.2f} ms  p99 {report['p99_ms']:.2f} ms",
+        f"{'Operation':<10}{'Count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    ]
+    for operation, stats in report['by_operation'].items():
+        lines.append(
+            f"{operation:<10}{stats['count']:>8}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+            f"{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}"
+        )
+    lines.append(f"Errors: {len(report['errors'])}  Corrupt reads: {report['corrupt_reads']}  "
+                 f"Lost updates: {report['lost_updates']} (field edits: {report['lost_edits']})  "
+                 f"Conflicting deletes/renames: {report['conflicting_removals']}")
+    for error in report['errors'][:5]:
+        lines.append(f"  {error}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(prog='python -m taskmanager.loadtest',
+                                     description="Replay task manager sessions concurrently and report performance.")
+    parser.add_argument('--file', default='loadtest_tasks.json', help="shared task file (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="number of processes")
+    parser.add_argument('--sessions', type=int, default=10, help="generated sessions per worker")
+    parser.add_argument('--steps', type=int, default=5, help="steps per generated session")
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help="operation weights, e.g. add=3,edit=2,delete=1,search=2,filter=1,kanban=1")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('--seed-tasks', type=int, help="overwrite the task file with this many generated tasks first")
+    parser.add_argument('--page-size', type=int, default=10, help="TaskManager page size")
+    parser.add_argument('--replay', help="JSON file of recorded sessions to replay instead of generating them")
+    parser.add_argument('--record', help="write the sessions that were run to this JSON file")
+    args = parser.parse_args(argv)
+
+    if args.seed_tasks is not None:
+        seed_task_file(args.file, args.seed_tasks, args.seed)
+    sessions = None
+    if args.replay:
+        with open(args.replay) as file:
+            sessions = json.load(file)
+
+    report = run_load_test(args.file, workers=max(args.workers, 1), sessions=sessions,
+                           session_count=args.sessions, steps_per_session=args.steps,
+                           mix=args.mix, seed=args.seed, page_size=args.page_size)
+    print(format_report(report))
+    if args.record:
+        with open(args.record, 'w') as file:
+            json.dump(report['sessions'], file, indent=4)
+
+
+if __name__ == '__main__':
+    main()
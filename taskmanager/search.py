@@ -0,0 +1,246 @@
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Matches in the task name count more than matches in the description.
+NAME_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+# BM25 tuning parameters.
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text):
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        list: The tokens, in order.
+    """
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def trigrams(term):
+    """
+    Return the set of trigrams of a term padded with '$' on both sides.
+
+    Args:
+        term (str): A single token.
+
+    Returns:
+        set: The term's trigrams.
+    """
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Compute the edit distance between two strings, giving up early.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit (optimal string alignment distance).
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+        max_distance (int): The largest distance of interest.
+
+    Returns:
+        int: The distance, or max_distance + 1 if it is larger than max_distance.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            distance = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            )
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                distance = min(distance, before_previous[j - 2] + 1)
+            current.append(distance)
+        # A transposition reaches back two rows, so stop once both are out of range.
+        if min(current) > max_distance and min(previous) > max_distance:
+            return max_distance + 1
+        before_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def default_max_distance(term):
+    """Return the edit distance allowed for a query term, based on its length."""
+    if len(term) <= 3:
+        return 0
+    if len(term) <= 6:
+        return 1
+    return 2
+
+
+class SearchIndex:
+    """
+    Inverted index over task names and descriptions for ranked, typo-tolerant search.
+
+    Term statistics and trigram postings are updated incrementally by add, remove
+    and update, so searching never has to scan the full task list.
+    """
+
+    def __init__(self, tasks=()):
+        """Initialize the index and add the given tasks."""
+        self.postings = defaultdict(dict)       # term -> {doc_id: weighted term frequency}
+        self.term_trigrams = defaultdict(set)   # trigram -> terms containing it
+        self.documents = {}                     # doc_id -> task
+        self.doc_terms = {}                     # doc_id -> Counter of weighted term frequencies
+        self.doc_lengths = {}                   # doc_id -> weighted length
+        self.total_length = 0
+        self._doc_ids = {}                      # id(task) -> doc_id
+        self._next_doc_id = 0
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, task):
+        return id(task) in self._doc_ids
+
+    def _task_terms(self, task):
+        terms = Counter()
+        for token in tokenize(task.get('task_name', '')):
+            terms[token] += NAME_WEIGHT
+        for token in tokenize(task.get('task_description', '')):
+            terms[token] += DESCRIPTION_WEIGHT
+        return terms
+
+    def add(self, task):
+        """Add a task to the index."""
+        if task in self:
+            self.update(task)
+            return
+        doc_id = self._next_doc_id
+        self._next_doc_id += 1
+        self._doc_ids[id(task)] = doc_id
+        self.documents[doc_id] = task
+        self._index_terms(doc_id, self._task_terms(task))
+
+    def remove(self, task):
+        """Remove a task from the index. Unknown tasks are ignored."""
+        doc_id = self._doc_ids.pop(id(task), None)
+        if doc_id is None:
+            return
+        self._unindex_terms(doc_id)
+        del self.documents[doc_id]
+
+    def update(self, task):
+        """Re-index a task after its name or description changed."""
+        doc_id = self._doc_ids.get(id(task))
+        if doc_id is None:
+            self.add(task)
+            return
+        self._unindex_terms(doc_id)
+        self._index_terms(doc_id, self._task_terms(task))
+
+    def _index_terms(self, doc_id, terms):
+        for term, frequency in terms.items():
+            postings = self.postings[term]
+            if not postings:
+                for trigram in trigrams(term):
+                    self.term_trigrams[trigram].add(term)
+            postings[doc_id] = frequency
+        length = sum(terms.values())
+        self.doc_terms[doc_id] = terms
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def _unindex_terms(self, doc_id):
+        for term in self.doc_terms.pop(doc_id):
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+                for trigram in trigrams(term):
+                    terms = self.term_trigrams[trigram]
+                    terms.discard(term)
+                    if not terms:
+                        del self.term_trigrams[trigram]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+
+    def expand_term(self, term, max_distance=None):
+        """
+        Find indexed terms within an edit distance of a query term.
+
+        Candidates are taken from the trigram postings and then checked with
+        edit_distance, so only terms sharing trigrams with the query are compared.
+
+        Args:
+            term (str): The query term.
+            max_distance (int): The largest allowed edit distance. Defaults to default_max_distance(term).
+
+        Returns:
+            dict: Maps each matching indexed term to its edit distance.
+        """
+        if max_distance is None:
+            max_distance = default_max_distance(term)
+        matches = {term: 0} if term in self.postings else {}
+        if max_distance == 0:
+            return matches
+
+        query_trigrams = trigrams(term)
+        shared = Counter()
+        for trigram in query_trigrams:
+            shared.update(self.term_trigrams.get(trigram, ()))
+        # Each edit changes at most four trigrams (a transposition of two characters).
+        min_shared = max(1, len(query_trigrams) - 4 * max_distance)
+        for candidate, count in shared.items():
+            if count < min_shared or candidate in matches:
+                continue
+            distance = edit_distance(term, candidate, max_distance)
+            if distance <= max_distance:
+                matches[candidate] = distance
+        return matches
+
+    def search(self, query, limit=10, fuzzy=True, max_distance=None):
+        """
+        Rank tasks against a query with BM25 scoring.
+
+        Args:
+            query (str): The search text.
+            limit (int): The maximum number of results.
+            fuzzy (bool): Whether to also match terms within the allowed edit distance.
+            max_distance (int): Override the allowed edit distance for every query term.
+
+        Returns:
+            list: (task, score) tuples, best match first.
+        """
+        if not self.documents or limit <= 0:
+            return []
+        doc_count = len(self.documents)
+        average_length = self.total_length / doc_count or 1
+        scores = defaultdict(float)
+
+        for term in set(tokenize(query)):
+            if fuzzy:
+                expansions = self.expand_term(term, max_distance)
+            else:
+                expansions = {term: 0} if term in self.postings else {}
+            for indexed_term, distance in expansions.items():
+                postings = self.postings[indexed_term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                # Fuzzy matches score less the further they are from the query term.
+                weight = idf / (1 + distance)
+                for doc_id, frequency in postings.items():
+                    norm = K1 * (1 - B + B * self.doc_lengths[doc_id] / average_length)
+                    scores[doc_id] += weight * frequency * (K1 + 1) / (frequency + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.documents[doc_id], score) for doc_id, score in best]
@@ -1,5 +1,61 @@
+import argparse
+import importlib
 import json
 import os
+import time
+from itertools import islice
+
+_module_started = time.perf_counter()
+
+try:
+    from .changefeed import ChangeFeed, event_from_record
+    from .history import TaskHistory
+except ImportError:  # Running task_manager.py directly as a script.
+    from changefeed import ChangeFeed, event_from_record
+    from history import TaskHistory
+
+_module_imported = time.perf_counter()
+
+
+def load_module(name):
+    """
+    Import a sibling module of this package on first use.
+
+    Modules that are only needed by some menu options (analytics may pull in NumPy)
+    are loaded through this function so that they do not slow down startup.
+
+    Args:
+        name (str): The module name, e.g. 'analytics'.
+
+    Returns:
+        module: The imported module.
+    """
+    if __package__:
+        return importlib.import_module(f'.{name}', __package__)
+    return importlib.import_module(name)
+
+
+PAGE_SIZE = 10
+# Building the search index takes a few seconds per 100,000 tasks, so the search
+# menu asks before building it for more tasks than this.
+SEARCH_INDEX_CONFIRM_SIZE = 20000
+
+
+def iter_page(tasks, start=0, size=PAGE_SIZE):
+    """
+    Yield one page of tasks with their 1-based task numbers, without copying the list.
+
+    Args:
+        tasks (list): A list of task dictionaries.
+        start (int): The index of the first task on the page.
+        size (int): The maximum number of tasks on the page.
+
+    Yields:
+        tuple: (task_number, task) pairs.
+    """
+    for index in range(max(start, 0), min(start + size, len(tasks))):
+        yield index + 1, tasks[index]
+
 
 def display_kanban_board(tasks):
     """
@@ -11,6 +67,10 @@ def display_kanban_board(tasks):
     Returns:
         str: Confirmation message after displaying the Kanban board.
     """
+    # Summary header
+    analytics = load_module('analytics')
+    print(analytics.format_summary(analytics.summarize(tasks)))
+
     # Organize tasks by status
     statuses = {
         "To be started": [],
@@ -62,10 +122,33 @@ def display_kanban_board(tasks):
 class TaskManager:
     """Class to manage tasks."""
 
-    def __init__(self, task_file='list_of_tasks.json'):
-        """Initialize the TaskManager with a list of tasks."""
+    def __init__(self, task_file='list_of_tasks.json', change_log=None, page_size=PAGE_SIZE):
+        """
+        Initialize the TaskManager. Tasks are loaded from task_file on first use.
+
+        If change_log is given, every change is also appended to that file as NDJSON.
+        Interactive listings show page_size tasks at a time.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
         self.task_file = task_file
-        self.tasks = self.load_tasks()
+        self.page_size = page_size
+        self._tasks = None
+        self.history = TaskHistory()
+        self.change_feed = ChangeFeed(change_log)
+        self._search_index = None
+        self._indexed_tasks = None
+
+    @property
+    def tasks(self):
+        """The list of tasks, loaded from the task file the first time it is needed."""
+        if self._tasks is None:
+            self._tasks = self.load_tasks()
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks):
+        self._tasks = tasks
 
     def load_tasks(self):
         """Load tasks from a JSON file."""
@@ -79,12 +162,14 @@ class TaskManager:
             return []
 
     def save_tasks(self):
-        """Save tasks to a JSON file."""
+        """Save tasks to a JSON file. Returns True if the tasks were saved."""
         try:
             with open(self.task_file, 'w') as file:
                 json.dump(self.tasks, file, indent=4)
+            return True
         except Exception as e:
             print(f"Error saving tasks: {e}")
+            return False
 
     def get_user_input(self):
         """Collect task details from the user."""
@@ -136,11 +221,15 @@ class TaskManager:
         """Add a new task."""
         task = self.get_user_input()
         self.tasks.append(task)
-        self.save_tasks()
+        record = self.history.record_add(len(self.tasks) - 1, task)
+        changes = self._describe_changes([(record, False)])
+        self._index_task(task)
+        if self.save_tasks():
+            self._publish_changes(changes)
         print("Task added successfully!")
 
-    def display_tasks(self, tasks=None):
-        """Display tasks."""
+    def display_tasks(self, tasks=None, start=0, limit=None):
+        """Display tasks, or only limit tasks from index start onwards."""
         if tasks is None:
             tasks = self.tasks
 
@@ -148,13 +237,137 @@ class TaskManager:
             print("No tasks available.")
             return
 
-        for index, task in enumerate(tasks, start=1):
-            print(f"\nTask {index}:")
-            print(f"Name: {task.get('task_name', 'N/A')}")
-            print(f"Due Date: {task.get('task_due_date', 'N/A')}")
-            print(f"Description: {task.get('task_description', 'N/A')}")
-            print(f"Priority Level: {task.get('priority_level', 'N/A')}")
-            print(f"Status: {task.get('status', 'N/A')}")
+        if limit is None:
+            limit = len(tasks)
+        for number, task in iter_page(tasks, start, limit):
+            self.display_task(number, task)
+
+    def display_task(self, number, task):
+        """Display a single task under its task number."""
+        print(f"\nTask {number}:")
+        print(f"Name: {task.get('task_name', 'N/A')}")
+        print(f"Due Date: {task.get('task_due_date', 'N/A')}")
+        print(f"Description: {task.get('task_description', 'N/A')}")
+        print(f"Priority Level: {task.get('priority_level', 'N/A')}")
+        print(f"Status: {task.get('status', 'N/A')}")
+
+    def browse_tasks(self, tasks):
+        """Display tasks one page at a time, asking before showing the next page."""
+        if not tasks:
+            print("No tasks available.")
+            return
+
+        for start in range(0, len(tasks), self.page_size):
+            self.display_tasks(tasks, start=start, limit=self.page_size)
+            remaining = len(tasks) - start - self.page_size
+            if remaining > 0:
+                more = input(f"\n{remaining} more task(s). Press Enter to show more or q to stop: ")
+                if more.strip().lower() == 'q':
+                    return
+
+    def iter_matching_tasks(self, keyword):
+        """Yield (task_number, task) pairs for tasks whose name or description contains keyword."""
+        keyword = keyword.lower()
+        for number, task in enumerate(self.tasks, start=1):
+            if (keyword in task.get('task_name', '').lower() or
+                    keyword in task.get('task_description', '').lower()):
+                yield number, task
+
+    def select_task(self, action):
+        """
+        Ask the user to choose a task, listing one page of tasks at a time.
+
+        Besides a task number, the user can enter n or p for the next or previous page,
+        g<page> to jump to a page of the task list, or /keyword to list matching tasks
+        with their numbers. While matches are shown, n and p page through the matches
+        and a lone / goes back to the task list.
+
+        Args:
+            action (str): The verb shown in the prompt, e.g. 'edit'.
+
+        Returns:
+            int: The index of the chosen task, or None if the input was not a valid task number.
+        """
+        page_count = max(1, -(-len(self.tasks) // self.page_size))
+        page = 0
+        search = None
+        show_page = True
+        while True:
+            if show_page and search is not None:
+                if not self._show_search_page(search):
+                    search = None
+            elif show_page:
+                self.display_tasks(start=page * self.page_size, limit=self.page_size)
+                if page_count > 1:
+                    print(f"\nPage {page + 1} of {page_count}. Enter n/p for the next/previous page, "
+                          "g<page> to jump to a page or /keyword to search.")
+            show_page = True
+
+            choice = input(f"Enter the task number you want to {action}: ").strip()
+            if choice.lower() == 'n':
+                if search is not None:
+                    if search['more']:
+                        search['page'] += 1
+                else:
+                    page = min(page + 1, page_count - 1)
+            elif choice.lower() == 'p':
+                if search is not None:
+                    search['page'] = max(search['page'] - 1, 0)
+                else:
+                    page = max(page - 1, 0)
+            elif choice.lower().startswith('g'):
+                try:
+                    page = min(max(int(choice[1:]), 1), page_count) - 1
+                    search = None
+                except ValueError:
+                    print("Please enter a valid page number.")
+                    show_page = False
+            elif choice.startswith('/'):
+                keyword = choice[1:].strip()
+                if keyword:
+                    search = {
+                        'keyword': keyword,
+                        'matches': self.iter_matching_tasks(keyword),
+                        'found': [],
+                        'page': 0,
+                        'more': False
+                    }
+                else:
+                    search = None
+            else:
+                try:
+                    task_number = int(choice)
+                except ValueError:
+                    print("Please enter a valid task number.")
+                    return None
+                if 1 <= task_number <= len(self.tasks):
+                    return task_number - 1
+                print("Invalid task number.")
+                return None
+
+    def _show_search_page(self, search):
+        """
+        Display the current page of a select_task search, reading matches only as far as needed.
+
+        Returns:
+            bool: False if nothing matches the keyword.
+        """
+        start = search['page'] * self.page_size
+        # Read one match past the page to know whether there is a next page.
+        needed = start + self.page_size + 1
+        search['found'].extend(islice(search['matches'], max(needed - len(search['found']), 0)))
+        search['more'] = len(search['found']) >= needed
+        matches = search['found'][start:start + self.page_size]
+        if not matches:
+            print(f"No tasks found matching '{search['keyword']}'.")
+            return False
+
+        print(f"Matches {start + 1}-{start + len(matches)} for '{search['keyword']}':")
+        for number, task in matches:
+            self.display_task(number, task)
+        if search['more'] or search['page'] > 0:
+            print("\nEnter n/p for the next/previous matches or / to go back to the task list.")
+        return True
 
     def edit_task(self):
         """Edit an existing task."""
@@ -162,17 +375,10 @@ class TaskManager:
             print("No tasks to edit.")
             return
 
-        self.display_tasks()
-        try:
-            task_number = int(input("Enter the task number you want to edit: "))
-            if 1 <= task_number <= len(self.tasks):
-                task = self.tasks[task_number - 1]
-            else:
-                print("Invalid task number.")
-                return
-        except ValueError:
-            print("Please enter a valid task number.")
+        index = self.select_task('edit')
+        if index is None:
             return
+        task = self.tasks[index]
 
         print("Enter new values (leave blank to keep current value):")
         task_name = input(f"Task Name [{task['task_name']}]: ").strip() or task['task_name']
@@ -212,6 +418,7 @@ class TaskManager:
                 print("Please enter a valid option (1, 2, or 3).")
 
         # Update the task
+        before = dict(task)
         task.update({
             "task_name": task_name,
             "task_due_date": task_due_date,
@@ -219,7 +426,11 @@ class TaskManager:
             "priority_level": priority_level,
             "status": status
         })
-        self.save_tasks()
+        record = self.history.record_edit(index, before, task)
+        changes = self._describe_changes([(record, False)] if record is not None else [])
+        self._index_task(task)
+        if self.save_tasks():
+            self._publish_changes(changes)
         print("Task updated successfully!")
 
     def delete_task(self):
@@ -228,37 +439,137 @@ class TaskManager:
             print("No tasks to delete.")
             return
 
-        self.display_tasks()
+        index = self.select_task('delete')
+        if index is None:
+            return
+        task = self.tasks.pop(index)
+        record = self.history.record_delete(index, task)
+        changes = self._describe_changes([(record, False)])
+        self._unindex_task(task)
+        if self.save_tasks():
+            self._publish_changes(changes)
+        print("Task deleted successfully!")
+
+    def undo(self):
+        """Undo the most recent change."""
+        record = self.history.undo(self.tasks)
+        if record is None:
+            print("Nothing to undo.")
+            return
+        self._reindex_history_step(record, reverse=True)
+        changes = self._describe_changes([(record, True)])
+        if self.save_tasks():
+            self._publish_changes(changes)
+        print("Last change undone.")
+
+    def redo(self):
+        """Redo the most recently undone change."""
+        record = self.history.redo(self.tasks)
+        if record is None:
+            print("Nothing to redo.")
+            return
+        self._reindex_history_step(record, reverse=False)
+        changes = self._describe_changes([(record, False)])
+        if self.save_tasks():
+            self._publish_changes(changes)
+        print("Change redone.")
+
+    def save_snapshot(self, name):
+        """Save the current state of the tasks under a name."""
+        self.history.save_snapshot(name)
+        print(f"Snapshot '{name}' saved.")
+
+    def restore_snapshot(self, name):
+        """Restore the tasks to a named snapshot. Later changes can be redone until a new change is made."""
+        changes = []
+
+        def on_step(record, reverse):
+            # Describe each step while the tasks still match it.
+            self._reindex_history_step(record, reverse)
+            changes.extend(self._describe_changes([(record, reverse)]))
+
         try:
-            task_number = int(input("Enter the task number you want to delete: "))
-            if 1 <= task_number <= len(self.tasks):
-                self.tasks.pop(task_number - 1)
-                self.save_tasks()
-                print("Task deleted successfully!")
-            else:
-                print("Invalid task number.")
-        except ValueError:
-            print("Please enter a valid task number.")
+            self.history.restore_snapshot(name, self.tasks, on_step=on_step)
+        except KeyError:
+            print(f"No snapshot named '{name}'.")
+            return
+        if self.save_tasks():
+            self._publish_changes(changes)
+        print(f"Snapshot '{name}' restored.")
+
+    def _describe_changes(self, steps):
+        """Describe (record, reverse) history steps as change feed events, if anyone consumes them."""
+        if not self.change_feed.active:
+            return []
+        return [event_from_record(record, reverse) for record, reverse in steps]
+
+    def _publish_changes(self, changes):
+        """Publish changes from _describe_changes to the change feed as one batch."""
+        if changes:
+            self.change_feed.publish(changes)
+
+    def _reindex_history_step(self, record, reverse):
+        """Keep the search index in step with an undone or redone change."""
+        if record['action'] == 'edit':
+            self._index_task(self.tasks[record['index']])
+        elif (record['action'] == 'add') != reverse:
+            self._index_task(record['task'])
+        else:
+            self._unindex_task(record['task'])
 
     def view_statistics(self):
         """Display statistics about tasks."""
-        total_tasks = len(self.tasks)
-        completed_tasks = len([task for task in self.tasks if task['status'] == 'Finished'])
-        print(f"Total tasks: {total_tasks}")
-        print(f"Completed tasks: {completed_tasks}")
+        summary = load_module('analytics').summarize(self.tasks)
+        print(f"Total tasks: {summary['total']}")
+        print(f"Completed tasks: {summary['completed']}")
+        print(f"Overdue tasks: {summary['overdue']}")
+        print(f"High priority open tasks: {summary['high_priority_open']}")
 
     def display_kanban_board(self):
         """Display tasks in a Kanban board format."""
         display_kanban_board(self.tasks)
 
-    def search_tasks(self, keyword):
-        """Search tasks by keyword."""
-        results = [
-            task for task in self.tasks
-            if keyword.lower() in task['task_name'].lower() or
-               keyword.lower() in task['task_description'].lower()
-        ]
-        return results
+    def get_search_index(self):
+        """
+        Return the search index, building it on first use.
+
+        add_task, edit_task and delete_task keep the index up to date. The index is
+        rebuilt if self.tasks was replaced or changed size behind its back; call
+        reindex() after editing task dictionaries directly.
+        """
+        if not self._search_index_is_current():
+            self.reindex()
+        return self._search_index
+
+    def _search_index_is_current(self):
+        return (self._search_index is not None and self._indexed_tasks is self.tasks
+                and len(self._search_index) == len(self.tasks))
+
+    def reindex(self):
+        """Rebuild the search index from the current tasks."""
+        self._search_index = load_module('search').SearchIndex(self.tasks)
+        self._indexed_tasks = self.tasks
+
+    def _index_task(self, task):
+        if self._search_index is not None:
+            self._search_index.add(task)
+
+    def _unindex_task(self, task):
+        if self._search_index is not None:
+            self._search_index.remove(task)
+
+    def search_tasks(self, keyword, ranked=False, limit=10, fuzzy=True):
+        """
+        Search tasks by keyword.
+
+        By default returns every task whose name or description contains the keyword,
+        in list order. With ranked=True returns up to limit tasks ordered by BM25 score,
+        also matching words within a small edit distance when fuzzy is True.
+        """
+        if ranked:
+            matches = self.get_search_index().search(keyword, limit=limit, fuzzy=fuzzy)
+            return [task for task, score in matches]
+        return [task for number, task in self.iter_matching_tasks(keyword)]
 
     def filter_tasks(self, filter_type, value):
         """Filter tasks based on filter_type and value."""
@@ -277,7 +588,18 @@ class TaskManager:
         results = self.search_tasks(keyword)
         if results:
             print(f"Found {len(results)} task(s) matching '{keyword}':")
-            self.display_tasks(results)
+            self.browse_tasks(results)
+            return
+        if not self._search_index_is_current() and len(self.tasks) > SEARCH_INDEX_CONFIRM_SIZE:
+            answer = input(f"No exact matches for '{keyword}'. Build the search index for {len(self.tasks)} "
+                           f"tasks to look for close matches? This may take a while. (y/n): ").strip().lower()
+            if answer != 'y':
+                print(f"No tasks found matching '{keyword}'.")
+                return
+        results = self.search_tasks(keyword, ranked=True)
+        if results:
+            print(f"No exact matches for '{keyword}'. Closest {len(results)} task(s):")
+            self.browse_tasks(results)
         else:
             print(f"No tasks found matching '{keyword}'.")
 
@@ -298,7 +620,7 @@ class TaskManager:
             value = status_options.get(status_choice)
             if value:
                 filtered_tasks = self.filter_tasks('status', value)
-                self.display_tasks(filtered_tasks)
+                self.browse_tasks(filtered_tasks)
             else:
                 print("Invalid status option.")
         elif filter_choice == '2':
@@ -306,7 +628,7 @@ class TaskManager:
                 priority_level = int(input("Enter priority level (1-10): ").strip())
                 if 1 <= priority_level <= 10:
                     filtered_tasks = self.filter_tasks('priority_level', priority_level)
-                    self.display_tasks(filtered_tasks)
+                    self.browse_tasks(filtered_tasks)
                 else:
                     print("Please enter a number between 1 and 10.")
             except ValueError:
@@ -314,7 +636,7 @@ class TaskManager:
         elif filter_choice == '3':
             due_date = input("Enter due date (format flexible, e.g., YYYY-MM-DD): ").strip()
             filtered_tasks = self.filter_tasks('due_date', due_date)
-            self.display_tasks(filtered_tasks)
+            self.browse_tasks(filtered_tasks)
         else:
             print("Invalid filter option.")
 
@@ -335,26 +657,74 @@ class TaskManager:
         elif choice == '7':
             print("Exiting Task Manager. Goodbye!")
             return False  # Signal to exit the loop
+        elif choice == '8':
+            self.undo()
+        elif choice == '9':
+            self.redo()
         else:
             print("Invalid choice. Please select a valid option.")
         return True  # Continue the loop
 
-def main():
-    task_manager = TaskManager()
+def print_menu():
+    """Print the main menu."""
+    print("\nTask Manager Menu:")
+    print("1. Add Task")
+    print("2. Display Kanban Board")
+    print("3. Edit Task")
+    print("4. Delete Task")
+    print("5. Search Tasks")
+    print("6. Filter Tasks")
+    print("7. Exit")
+    print("8. Undo Last Change")
+    print("9. Redo Last Change")
+
+
+def _positive_int(value):
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main(argv=None, started=None, imported=None):
+    """
+    Run the interactive Task Manager.
+
+    Args:
+        argv (list): Command line arguments. Defaults to sys.argv[1:].
+        started (float): time.perf_counter() value when startup began, for --startup-time.
+            Defaults to when this module started importing.
+        imported (float): time.perf_counter() value when the imports finished, for --startup-time.
+    """
+    parser = argparse.ArgumentParser(prog='taskmanager', description="Manage tasks from the command line.")
+    parser.add_argument('--file', default='list_of_tasks.json', help="task file to use (default: %(default)s)")
+    parser.add_argument('--change-log', help="append every task change to this NDJSON file")
+    parser.add_argument('--page-size', type=_positive_int, default=PAGE_SIZE,
+                        help="number of tasks shown per page (default: %(default)s)")
+    parser.add_argument('--startup-time', action='store_true', help="report import and time-to-menu timings")
+    args = parser.parse_args(argv)
+
+    task_manager = TaskManager(task_file=args.file, change_log=args.change_log,
+                               page_size=args.page_size)
+
+    print_menu()
+    if args.startup_time:
+        menu_shown = time.perf_counter()
+        started = started if started is not None else _module_started
+        imported = imported if imported is not None else _module_imported
+        print(f"Startup: imports {(imported - started) * 1000:.1f} ms, "
+              f"time to menu {(menu_shown - started) * 1000:.1f} ms")
 
     continue_loop = True
     while continue_loop:
-        print("\nTask Manager Menu:")
-        print("1. Add Task")
-        print("2. Display Kanban Board")
-        print("3. Edit Task")
-        print("4. Delete Task")
-        print("5. Search Tasks")
-        print("6. Filter Tasks")
-        print("7. Exit")
-
         choice = input("Choose an option: ").strip()
         continue_loop = task_manager.handle_menu_choice(choice)
+        if continue_loop:
+            print_menu()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,121 @@
+import unittest
+from datetime import date
+
+from taskmanager import analytics
+
+
+class TestAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        self.today = date(2024, 1, 10)
+        self.tasks = [
+            {
+                "task_name": "Overdue task",
+                "task_due_date": "2024-01-05",
+                "task_description": "Past its due date.",
+                "priority_level": 9,
+                "status": "In progress"
+            },
+            {
+                "task_name": "Finished task",
+                "task_due_date": "2024-01-01",
+                "task_description": "Done before the due date.",
+                "priority_level": 9,
+                "status": "Finished"
+            },
+            {
+                "task_name": "Upcoming task",
+                "task_due_date": "2024-01-12",
+                "task_description": "Due soon.",
+                "priority_level": 4,
+                "status": "To be started"
+            },
+            {
+                "task_name": "Undated task",
+                "task_due_date": "next weekend",
+                "task_description": "Free text due date.",
+                "priority_level": 2
+                # 'status' key is missing
+            }
+        ]
+
+    def test_parse_due_date(self):
+        """Test that only YYYY-MM-DD due dates are parsed."""
+        self.assertEqual(analytics.parse_due_date("2024-01-05"), date(2024, 1, 5).toordinal())
+        self.assertEqual(analytics.parse_due_date("2024-1-5"), date(2024, 1, 5).toordinal())
+        self.assertEqual(analytics.parse_due_date("tomorrow midnight"), analytics.NO_DUE_DATE)
+        self.assertEqual(analytics.parse_due_date("2024-02-30"), analytics.NO_DUE_DATE)
+        self.assertEqual(analytics.parse_due_date("2024-W01-1"), analytics.NO_DUE_DATE)
+
+    def test_priority_histogram(self):
+        """Test counting tasks per priority level."""
+        columns = analytics.build_columns(self.tasks, use_numpy=False)
+        histogram = analytics.priority_histogram(columns)
+        self.assertEqual(len(histogram), 10)
+        self.assertEqual(histogram[9 - 1], 2)
+        self.assertEqual(histogram[4 - 1], 1)
+        self.assertEqual(histogram[2 - 1], 1)
+
+    def test_priority_distribution_by_status(self):
+        """Test per-status priority counts, with a missing status counted as 'To be started'."""
+        columns = analytics.build_columns(self.tasks, use_numpy=False)
+        distribution = analytics.priority_distribution_by_status(columns)
+        self.assertEqual(distribution["In progress"][9 - 1], 1)
+        self.assertEqual(distribution["Finished"][9 - 1], 1)
+        self.assertEqual(sum(distribution["To be started"]), 2)
+
+    def test_overdue_count_ignores_finished_and_undated_tasks(self):
+        """Test that only unfinished tasks with a past due date are overdue."""
+        columns = analytics.build_columns(self.tasks, use_numpy=False)
+        self.assertEqual(analytics.overdue_count(columns, today=self.today), 1)
+
+    def test_burndown(self):
+        """Test the planned burn-down series over unfinished dated tasks."""
+        columns = analytics.build_columns(self.tasks, use_numpy=False)
+        series = analytics.burndown(columns, start=date(2024, 1, 4), days=10)
+        self.assertEqual(len(series), 10)
+        self.assertEqual(series[0], (date(2024, 1, 4), 2))
+        self.assertEqual(series[1], (date(2024, 1, 5), 1))
+        self.assertEqual(series[-1], (date(2024, 1, 13), 0))
+
+    def test_summarize(self):
+        """Test the summary used by the Kanban board header."""
+        summary = analytics.summarize(self.tasks, today=self.today, use_numpy=False)
+        self.assertEqual(summary['total'], 4)
+        self.assertEqual(summary['completed'], 1)
+        self.assertEqual(summary['open'], 3)
+        self.assertEqual(summary['overdue'], 1)
+        self.assertEqual(summary['high_priority_open'], 1)
+        self.assertIn("Overdue: 1", analytics.format_summary(summary))
+
+    def test_status_counts_ignore_invalid_priorities(self):
+        """Test that tasks with out-of-range or non-numeric priorities still count towards their status."""
+        tasks = [
+            {"task_name": "Zero", "priority_level": 0, "status": "Finished"},
+            {"task_name": "Text", "priority_level": "high", "status": "Finished"},
+            {"task_name": "Twelve", "priority_level": 12, "status": "Finished"},
+            {"task_name": "Open", "priority_level": 11, "status": "In progress"}
+        ]
+        summary = analytics.summarize(tasks, today=self.today, use_numpy=False)
+        self.assertEqual(summary['completed'], 3)
+        self.assertEqual(summary['open'], 1)
+        self.assertEqual(summary['by_status'], {"To be started": 0, "In progress": 1, "Finished": 3})
+
+    @unittest.skipIf(analytics.np is None, "NumPy is not installed")
+    def test_numpy_matches_pure_python(self):
+        """Test that the vectorized path gives the same results as the pure Python path."""
+        self.assertEqual(
+            analytics.summarize(self.tasks, today=self.today, use_numpy=True),
+            analytics.summarize(self.tasks, today=self.today, use_numpy=False)
+        )
+        python_columns = analytics.build_columns(self.tasks, use_numpy=False)
+        numpy_columns = analytics.build_columns(self.tasks, use_numpy=True)
+        start = date(2024, 1, 1)
+        self.assertEqual(
+            analytics.burndown(numpy_columns, start=start),
+            analytics.burndown(python_columns, start=start)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from taskmanager.changefeed import ChangeFeed, read_events
+
+
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        self.log_file = 'test_changes.ndjson'
+
+    def tearDown(self):
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+
+    def test_subscribers_receive_sequenced_events(self):
+        """Test that subscribers get every event with increasing sequence numbers."""
+        feed = ChangeFeed()
+        received = []
+        feed.subscribe(received.append)
+        feed.publish([('created', 0, None, {"task_name": "Task 1"})])
+        feed.publish([('updated', 0, {"status": "To be started"}, {"status": "Finished"})])
+        self.assertEqual([event['seq'] for event in received], [1, 2])
+        self.assertEqual(received[1]['after'], {"status": "Finished"})
+
+        feed.unsubscribe(received.append)
+        feed.publish([('deleted', 0, {"task_name": "Task 1"}, None)])
+        self.assertEqual(len(received), 2)
+
+    def test_failing_subscriber_does_not_stop_others(self):
+        """Test that an exception in one subscriber is reported and the others still run."""
+        feed = ChangeFeed()
+        received = []
+
+        def broken(event):
+            raise RuntimeError("consumer down")
+
+        feed.subscribe(broken)
+        feed.subscribe(received.append)
+        with patch('builtins.print') as mock_print:
+            feed.publish([('created', 0, None, {"task_name": "Task 1"})])
+            mock_print.assert_called_with("Error in change feed subscriber: consumer down")
+        self.assertEqual(len(received), 1)
+
+    def test_read_events_resumes_from_offset(self):
+        """Test that a consumer can resume reading the log from a saved offset."""
+        feed = ChangeFeed(self.log_file)
+        feed.publish([('created', 0, None, {"task_name": "Task 1"}),
+                      ('created', 1, None, {"task_name": "Task 2"})])
+        events = list(read_events(self.log_file))
+        self.assertEqual([event['seq'] for event, offset in events], [1, 2])
+
+        offset = events[-1][1]
+        feed.publish([('deleted', 1, {"task_name": "Task 2"}, None)])
+        self.assertEqual([event['type'] for event, _ in read_events(self.log_file, offset)], ['deleted'])
+
+    def test_partial_line_is_not_read(self):
+        """Test that a half-written event is left for a later read."""
+        ChangeFeed(self.log_file).publish([('created', 0, None, {"task_name": "Task 1"})])
+        with open(self.log_file, 'a') as file:
+            file.write('{"seq": 2, "type": "cre')
+        self.assertEqual(len(list(read_events(self.log_file))), 1)
+
+    def test_publish_after_partial_write(self):
+        """Test that publishing after an interrupted write replaces the unfinished line."""
+        ChangeFeed(self.log_file).publish([('created', 0, None, {"task_name": "Task 1"})])
+        with open(self.log_file, 'a') as file:
+            file.write('{"seq": 2, "type": "cre')
+        ChangeFeed(self.log_file).publish([('deleted', 0, {"task_name": "Task 1"}, None)])
+        events = [event for event, _ in read_events(self.log_file)]
+        self.assertEqual([(event['seq'], event['type']) for event in events], [(1, 'created'), (2, 'deleted')])
+
+    def test_unreadable_line_is_skipped(self):
+        """Test that a complete line that is not valid JSON does not stop the reader."""
+        feed = ChangeFeed(self.log_file)
+        feed.publish([('created', 0, None, {"task_name": "Task 1"})])
+        with open(self.log_file, 'a') as file:
+            file.write('{"seq": 2, "type": "cre\n')
+        feed.publish([('deleted', 0, {"task_name": "Task 1"}, None)])
+        with patch('builtins.print') as mock_print:
+            events = [event for event, _ in read_events(self.log_file)]
+            mock_print.assert_called_once()
+        self.assertEqual([event['type'] for event in events], ['created', 'deleted'])
+
+    def test_sequence_continues_after_restart(self):
+        """Test that a new feed on an existing log continues the sequence."""
+        ChangeFeed(self.log_file).publish([('created', 0, None, {"task_name": "Task 1"})] * 3)
+        event = ChangeFeed(self.log_file).publish([('deleted', 0, {"task_name": "Task 1"}, None)])[0]
+        self.assertEqual(event['seq'], 4)
+        with open(self.log_file) as file:
+            self.assertEqual(json.loads(file.readlines()[-1])['seq'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+from taskmanager.history import TaskHistory, diff_fields
+
+
+class TestTaskHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.history = TaskHistory()
+        self.tasks = [
+            {
+                "task_name": "Task 1",
+                "task_due_date": "2023-12-31",
+                "task_description": "Description 1",
+                "priority_level": 5,
+                "status": "To be started"
+            }
+        ]
+
+    def add(self, task):
+        self.tasks.append(task)
+        self.history.record_add(len(self.tasks) - 1, task)
+
+    def edit(self, index, **changes):
+        before = dict(self.tasks[index])
+        self.tasks[index].update(changes)
+        self.history.record_edit(index, before, self.tasks[index])
+
+    def delete(self, index):
+        self.history.record_delete(index, self.tasks.pop(index))
+
+    def test_diff_fields_keeps_only_changes(self):
+        """Test that edit records store only the changed fields."""
+        old_values, new_values = diff_fields({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": 4})
+        self.assertEqual(old_values, {"b": 2})
+        self.assertEqual(new_values, {"b": 3, "c": 4})
+
+    def test_undo_and_redo(self):
+        """Test undoing and redoing an add, an edit and a delete."""
+        self.add({"task_name": "Task 2", "status": "In progress"})
+        self.edit(0, status="Finished")
+        self.delete(1)
+        self.assertEqual(len(self.tasks), 1)
+
+        self.history.undo(self.tasks)
+        self.assertEqual(self.tasks[1]["task_name"], "Task 2")
+        self.history.undo(self.tasks)
+        self.assertEqual(self.tasks[0]["status"], "To be started")
+        self.history.undo(self.tasks)
+        self.assertEqual(len(self.tasks), 1)
+        self.assertIsNone(self.history.undo(self.tasks))
+
+        self.history.redo(self.tasks)
+        self.history.redo(self.tasks)
+        self.assertEqual(self.tasks[0]["status"], "Finished")
+        self.assertEqual(len(self.tasks), 2)
+
+    def test_new_change_discards_redo(self):
+        """Test that recording a change after an undo clears the redo history."""
+        self.edit(0, priority_level=8)
+        self.history.undo(self.tasks)
+        self.edit(0, priority_level=2)
+        self.assertFalse(self.history.can_redo())
+        self.assertEqual(self.tasks[0]["priority_level"], 2)
+
+    def test_snapshots(self):
+        """Test restoring and viewing named snapshots."""
+        self.history.save_snapshot("start")
+        self.edit(0, task_name="Renamed")
+        self.add({"task_name": "Task 2"})
+        self.history.save_snapshot("later")
+
+        past = self.history.tasks_at("start", self.tasks)
+        self.assertEqual([task["task_name"] for task in past], ["Task 1"])
+        self.assertEqual(self.tasks[0]["task_name"], "Renamed")
+
+        self.history.restore_snapshot("start", self.tasks)
+        self.assertEqual([task["task_name"] for task in self.tasks], ["Task 1"])
+        self.history.restore_snapshot("later", self.tasks)
+        self.assertEqual([task["task_name"] for task in self.tasks], ["Renamed", "Task 2"])
+
+    def test_max_steps_drops_oldest_records(self):
+        """Test that the history keeps at most max_steps records."""
+        self.history = TaskHistory(max_steps=2)
+        self.history.save_snapshot("start")
+        for priority in (6, 7, 8):
+            self.edit(0, priority_level=priority)
+        self.assertEqual(len(self.history.records), 2)
+        self.assertNotIn("start", self.history.snapshots)
+        while self.history.undo(self.tasks):
+            pass
+        self.assertEqual(self.tasks[0]["priority_level"], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
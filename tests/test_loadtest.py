@@ -0,0 +1,114 @@
+import json
+import os
+import unittest
+from collections import Counter
+
+from taskmanager import loadtest
+from taskmanager.task_manager import TaskManager
+
+
+class TestLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.test_task_file = 'test_loadtest_tasks.json'
+        loadtest.seed_task_file(self.test_task_file, 20)
+
+    def tearDown(self):
+        if os.path.exists(self.test_task_file):
+            os.remove(self.test_task_file)
+
+    def test_parse_mix(self):
+        """Test parsing an operation mix and rejecting unknown operations."""
+        self.assertEqual(loadtest.parse_mix("add=2, search=1"), {'add': 2, 'search': 1})
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix("fly=1")
+
+    def test_count_lost_updates(self):
+        """Test that stale duplicate deletes and renames are conflicts, not extra lost updates."""
+        initial = Counter({"seed-0": 1, "seed-1": 1})
+        # Two stale sessions delete seed-0; both saves agree, so nothing is lost.
+        self.assertEqual(
+            loadtest.count_lost_updates(initial, Counter(), Counter({"seed-0": 2}), Counter({"seed-1": 1})),
+            (0, 1)
+        )
+        # Two stale sessions rename seed-1; the second save overwrites the first rename.
+        self.assertEqual(
+            loadtest.count_lost_updates(initial, Counter({"a": 1, "b": 1}), Counter({"seed-1": 2}),
+                                        Counter({"seed-0": 1, "b": 1})),
+            (1, 1)
+        )
+        # A deleted task written back by a stale save is a lost update.
+        self.assertEqual(
+            loadtest.count_lost_updates(initial, Counter(), Counter({"seed-0": 1}), initial),
+            (1, 0)
+        )
+
+    def test_stale_save_loses_field_edit(self):
+        """Test that a priority edit overwritten by a stale save is counted as a lost edit."""
+        names_added, names_removed, field_edits, removed_at = Counter(), Counter(), {}, {}
+        first = TaskManager(task_file=self.test_task_file)
+        second = TaskManager(task_file=self.test_task_file)
+        for task_manager in (first, second):
+            task_manager.tasks
+            task_manager.change_feed.subscribe(
+                loadtest._track_changes(task_manager, names_added, names_removed, field_edits, removed_at)
+            )
+        # Keep the name and change only the priority.
+        loadtest.run_step(first, {'choice': '3', 'inputs': ['1', '', '', '', '10', '']})
+        self.assertEqual(field_edits[("seed-0", "priority_level")][1], 10)
+        self.assertEqual(names_added, Counter())
+
+        with open(self.test_task_file) as file:
+            final_tasks = json.load(file)
+        self.assertEqual(loadtest.count_lost_edits(field_edits, removed_at, final_tasks), 0)
+        loadtest.run_step(second, {'choice': '1', 'inputs': ['Late task', '2024-01-01', '', '5', '1']})
+        with open(self.test_task_file) as file:
+            final_tasks = json.load(file)
+        self.assertEqual(loadtest.count_lost_edits(field_edits, removed_at, final_tasks), 1)
+
+    def test_count_lost_edits_skips_removed_names(self):
+        """Test that edits to tasks deleted or renamed afterwards are not checked."""
+        field_edits = {("seed-0", "status"): (1.0, "Finished")}
+        final_tasks = [{"task_name": "seed-0", "status": "In progress"}]
+        self.assertEqual(loadtest.count_lost_edits(field_edits, {}, final_tasks), 1)
+        self.assertEqual(loadtest.count_lost_edits(field_edits, {"seed-0": 2.0}, final_tasks), 0)
+        self.assertEqual(loadtest.count_lost_edits(field_edits, {}, []), 0)
+
+    def test_run_worker_generated_sessions(self):
+        """Test that generated sessions run every operation without errors."""
+        mix = {operation: 1 for operation in loadtest.MENU_CHOICES}
+        result = loadtest.run_worker(self.test_task_file, 0, session_count=4, steps_per_session=10, mix=mix)
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(sum(len(values) for name, values in result['latencies'].items() if name != 'load'), 40)
+        self.assertEqual(len(result['latencies']['load']), 4)
+        self.assertEqual(len(result['sessions']), 4)
+
+    def test_run_worker_reports_short_sessions(self):
+        """Test that a recorded step without enough input is reported as an error."""
+        sessions = [[{"choice": "1", "inputs": ["Only a name"]}]]
+        result = loadtest.run_worker(self.test_task_file, 0, sessions=sessions)
+        self.assertEqual(len(result['errors']), 1)
+        self.assertIn("SessionInputError", result['errors'][0])
+
+    def test_replay_single_worker_has_no_lost_updates(self):
+        """Test a replayed session against the shared file and the lost update count."""
+        sessions = [[
+            {"choice": "1", "inputs": ["Replayed task", "2024-01-01", "", "5", "1"]},
+            {"choice": "4", "inputs": ["1"]},
+            {"choice": "3", "inputs": ["1", "", "", "", "9", "3"]},
+            {"choice": "5", "inputs": ["replayed", "q"]}
+        ]]
+        report = loadtest.run_load_test(self.test_task_file, workers=1, sessions=sessions)
+        self.assertEqual(report['operations'], 4)
+        self.assertEqual(report['errors'], [])
+        self.assertEqual(report['lost_updates'], 0)
+        self.assertEqual(report['lost_edits'], 0)
+        with open(self.test_task_file) as file:
+            names = [task['task_name'] for task in json.load(file)]
+        self.assertIn("Replayed task", names)
+        self.assertNotIn("seed-0", names)
+        self.assertIn("Lost updates: 0", loadtest.format_report(report))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from taskmanager.search import SearchIndex, edit_distance, tokenize
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tasks = [
+            {
+                "task_name": "Write report",
+                "task_due_date": "2023-12-31",
+                "task_description": "Write the annual report.",
+                "priority_level": 5,
+                "status": "In progress"
+            },
+            {
+                "task_name": "Prepare presentation",
+                "task_due_date": "2023-12-15",
+                "task_description": "Prepare slides and a short report summary.",
+                "priority_level": 7,
+                "status": "To be started"
+            },
+            {
+                "task_name": "Book flights",
+                "task_due_date": "2024-01-05",
+                "task_description": "Flights for the conference.",
+                "priority_level": 3,
+                "status": "To be started"
+            }
+        ]
+        self.index = SearchIndex(self.tasks)
+
+    def test_tokenize(self):
+        """Test that tokenize lowercases and drops punctuation."""
+        self.assertEqual(tokenize("Write the Annual report."), ["write", "the", "annual", "report"])
+
+    def test_edit_distance(self):
+        """Test edit_distance with and without the early cutoff."""
+        self.assertEqual(edit_distance("report", "reprot", 2), 1)
+        self.assertEqual(edit_distance("report", "rpeort", 2), 1)
+        self.assertEqual(edit_distance("report", "repast", 2), 2)
+        self.assertEqual(edit_distance("report", "report", 2), 0)
+        self.assertEqual(edit_distance("report", "flights", 2), 3)
+
+    def test_ranked_search_prefers_name_matches(self):
+        """Test that a task naming the term outranks one that only mentions it."""
+        results = self.index.search("report")
+        self.assertEqual([task for task, score in results], [self.tasks[0], self.tasks[1]])
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_fuzzy_search_matches_typos(self):
+        """Test that a misspelled term still finds the task."""
+        results = self.index.search("flihgts")
+        self.assertEqual(results[0][0], self.tasks[2])
+        self.assertEqual(self.index.search("flihgts", fuzzy=False), [])
+
+    def test_search_limit(self):
+        """Test that search returns at most limit results."""
+        self.assertEqual(len(self.index.search("report", limit=1)), 1)
+
+    def test_update_and_remove_maintain_postings(self):
+        """Test that update and remove keep term statistics and trigrams consistent."""
+        self.tasks[2]["task_name"] = "Book hotel"
+        self.tasks[2]["task_description"] = "Hotel near the venue."
+        self.index.update(self.tasks[2])
+        self.assertEqual(self.index.search("flights"), [])
+        self.assertEqual(self.index.search("hotel")[0][0], self.tasks[2])
+
+        self.index.remove(self.tasks[0])
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn("annual", self.index.postings)
+        self.assertFalse(any("annual" in terms for terms in self.index.term_trigrams.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
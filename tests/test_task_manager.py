@@ -213,6 +213,35 @@ class TestTaskManager(unittest.TestCase):
                 self.assertFalse(continue_loop)
                 mock_print.assert_called_with("Exiting Task Manager. Goodbye!")
 
+    def test_tasks_are_loaded_on_first_use(self):
+        """Test that TaskManager does not read the task file until the tasks are needed."""
+        with patch.object(TaskManager, 'load_tasks', return_value=[]) as mock_load:
+            task_manager = TaskManager(task_file=self.test_task_file)
+            mock_load.assert_not_called()
+            self.assertEqual(task_manager.tasks, [])
+            task_manager.tasks
+            mock_load.assert_called_once()
+
+    def test_main_exits_without_loading_tasks(self):
+        """Test that showing the menu and exiting never reads the task file."""
+        from taskmanager import main
+        with patch.object(TaskManager, 'load_tasks', return_value=[]) as mock_load:
+            with patch('builtins.input', side_effect=['7']):
+                with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                    main(['--file', self.test_task_file, '--startup-time'])
+        mock_load.assert_not_called()
+        self.assertIn("Task Manager Menu:", fake_out.getvalue())
+        self.assertIn("time to menu", fake_out.getvalue())
+
+    def test_main_rejects_page_size_below_one(self):
+        """Test that --page-size 0 is rejected instead of being changed to 1."""
+        from taskmanager import main
+        for value in ('0', '-3'):
+            with patch('sys.stderr', new=io.StringIO()) as fake_err:
+                with self.assertRaises(SystemExit):
+                    main(['--file', self.test_task_file, '--page-size', value])
+            self.assertIn("must be at least 1", fake_err.getvalue())
+
     def test_display_kanban_board_with_tasks(self):
         """Test display_kanban_board with multiple tasks."""
         # Add sample tasks
@@ -333,6 +362,289 @@ class TestTaskManager(unittest.TestCase):
         results = self.task_manager.search_tasks('presentation')
         self.assertEqual(len(results), 0)
 
+    def test_search_tasks_ranked_with_typo(self):
+        """Test ranked search_tasks finds tasks despite a typo and orders by relevance."""
+        tasks = [
+            {
+                "task_name": "Prepare presentation",
+                "task_due_date": "2023-12-15",
+                "task_description": "Mention the report in the slides.",
+                "priority_level": 7,
+                "status": "To be started"
+            },
+            {
+                "task_name": "Submit report",
+                "task_due_date": "2023-12-20",
+                "task_description": "Submit the annual report to management.",
+                "priority_level": 8,
+                "status": "To be started"
+            }
+        ]
+        self.task_manager.tasks.extend(tasks)
+        self.task_manager.save_tasks()
+
+        self.assertEqual(self.task_manager.search_tasks('reprot'), [])
+        results = self.task_manager.search_tasks('reprot', ranked=True)
+        self.assertEqual(results, [tasks[1], tasks[0]])
+
+    def test_search_index_follows_task_changes(self):
+        """Test that the ranked search index picks up added and deleted tasks."""
+        self.assertEqual(self.task_manager.search_tasks('groceries', ranked=True), [])
+        with patch('builtins.input', side_effect=['Buy groceries', '2024-01-01', 'Milk and eggs', '3', '1']):
+            with patch('builtins.print'):
+                self.task_manager.add_task()
+        self.assertEqual(len(self.task_manager.search_tasks('groceries', ranked=True)), 1)
+
+        with patch('builtins.input', side_effect=['1']):
+            with patch('builtins.print'):
+                self.task_manager.delete_task()
+        self.assertEqual(self.task_manager.search_tasks('groceries', ranked=True), [])
+
+    @patch('taskmanager.task_manager.SEARCH_INDEX_CONFIRM_SIZE', 1)
+    def test_search_menu_asks_before_building_large_index(self):
+        """Test that the search menu asks before building the index for a large task list."""
+        self.task_manager.tasks.extend([
+            {"task_name": "Submit report", "task_description": "Annual report."},
+            {"task_name": "Buy groceries", "task_description": "Milk and eggs."}
+        ])
+        with patch('builtins.input', side_effect=['reprot', 'n']):
+            with patch('builtins.print') as mock_print:
+                self.task_manager.search_tasks_menu()
+                mock_print.assert_called_with("No tasks found matching 'reprot'.")
+        self.assertIsNone(self.task_manager._search_index)
+
+        with patch('builtins.input', side_effect=['reprot', 'y', 'q']):
+            with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+                self.task_manager.search_tasks_menu()
+                self.assertIn("Submit report", mock_stdout.getvalue())
+        # Once the index exists, a miss uses it without asking again.
+        with patch('builtins.input', side_effect=['groceres', 'q']):
+            with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+                self.task_manager.search_tasks_menu()
+                self.assertIn("Buy groceries", mock_stdout.getvalue())
+
+    def test_undo_and_redo_delete(self):
+        """Test undoing and redoing a deleted task."""
+        self.task_manager.tasks.append({
+            "task_name": "Task to Restore",
+            "task_due_date": "2023-12-31",
+            "task_description": "Deleted by mistake.",
+            "priority_level": 5,
+            "status": "To be started"
+        })
+        self.task_manager.save_tasks()
+
+        with patch('builtins.input', side_effect=['1']):
+            with patch('builtins.print'):
+                self.task_manager.delete_task()
+                self.task_manager.undo()
+        self.assertEqual(self.task_manager.load_tasks()[0]['task_name'], "Task to Restore")
+        self.assertEqual(len(self.task_manager.search_tasks('restore', ranked=True)), 1)
+
+        with patch('builtins.print'):
+            self.task_manager.redo()
+        self.assertEqual(self.task_manager.load_tasks(), [])
+
+    def test_undo_edit(self):
+        """Test undoing an edit restores the previous values."""
+        self.task_manager.tasks.append({
+            "task_name": "Task to Edit",
+            "task_due_date": "2023-12-31",
+            "task_description": "Original description.",
+            "priority_level": 5,
+            "status": "To be started"
+        })
+        self.task_manager.save_tasks()
+
+        with patch('builtins.input', side_effect=['1', 'Edited', '', '', '9', '3']):
+            with patch('builtins.print'):
+                self.task_manager.edit_task()
+        self.assertEqual(self.task_manager.tasks[0]['priority_level'], 9)
+
+        with patch('builtins.print') as mock_print:
+            self.task_manager.undo()
+            self.task_manager.undo()
+            mock_print.assert_called_with("Nothing to undo.")
+        self.assertEqual(self.task_manager.tasks[0]['task_name'], "Task to Edit")
+        self.assertEqual(self.task_manager.tasks[0]['priority_level'], 5)
+        self.assertEqual(self.task_manager.tasks[0]['status'], "To be started")
+
+    def test_change_feed_events(self):
+        """Test that adding, editing, deleting and undoing tasks publish change events."""
+        events = []
+        self.task_manager.change_feed.subscribe(events.append)
+        with patch('builtins.print'):
+            with patch('builtins.input', side_effect=['Feed Task', '2024-01-01', '', '4', '1']):
+                self.task_manager.add_task()
+            with patch('builtins.input', side_effect=['1', '', '', '', '', '3']):
+                self.task_manager.edit_task()
+            with patch('builtins.input', side_effect=['1']):
+                self.task_manager.delete_task()
+            self.task_manager.undo()
+
+        self.assertEqual([event['type'] for event in events], ['created', 'updated', 'deleted', 'created'])
+        self.assertEqual([event['seq'] for event in events], [1, 2, 3, 4])
+        self.assertEqual(events[0]['after']['task_name'], "Feed Task")
+        self.assertEqual(events[1]['before'], {"status": "To be started"})
+        self.assertEqual(events[1]['after'], {"status": "Finished"})
+        self.assertEqual(events[2]['before']['status'], "Finished")
+
+    def test_delete_task_lists_one_page(self):
+        """Test that deleting from a large task list only prints one page of tasks."""
+        self.task_manager.tasks.extend(
+            {
+                "task_name": f"Task {number}",
+                "task_due_date": "2023-12-31",
+                "task_description": "Bulk task",
+                "priority_level": 5,
+                "status": "To be started"
+            }
+            for number in range(1, 101)
+        )
+        self.task_manager.save_tasks()
+
+        with patch('builtins.input', side_effect=['n', 'g10', '95']):
+            with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                self.task_manager.delete_task()
+                output = fake_out.getvalue()
+        self.assertEqual(output.count("Name: "), 30)
+        self.assertIn("Page 10 of 10.", output)
+        self.assertIn("Name: Task 20\n", output)
+        self.assertNotIn("Name: Task 21\n", output)
+        self.assertEqual(len(self.task_manager.tasks), 99)
+        self.assertNotIn("Task 95", [task['task_name'] for task in self.task_manager.tasks])
+
+    def test_select_task_by_search(self):
+        """Test that /keyword lists matching tasks with their task numbers."""
+        self.task_manager.tasks.extend([
+            {
+                "task_name": "Write report",
+                "task_due_date": "2023-12-31",
+                "task_description": "Write the annual report.",
+                "priority_level": 5,
+                "status": "In progress"
+            },
+            {
+                "task_name": "Book flights",
+                "task_due_date": "2024-01-05",
+                "task_description": "Flights for the conference.",
+                "priority_level": 3,
+                "status": "To be started"
+            }
+        ])
+        with patch('builtins.input', side_effect=['/flights', '2']):
+            with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                index = self.task_manager.select_task('edit')
+        self.assertEqual(index, 1)
+        self.assertIn("Matches 1-1 for 'flights':", fake_out.getvalue())
+
+    def test_select_task_pages_through_search_matches(self):
+        """Test that n/p page through search matches so later matches can be chosen."""
+        self.task_manager.tasks.extend(
+            {
+                "task_name": f"{'Report' if number % 2 else 'Other'} {number}",
+                "task_due_date": "2023-12-31",
+                "task_description": "Bulk task",
+                "priority_level": 5,
+                "status": "To be started"
+            }
+            for number in range(1, 41)
+        )
+        with patch('builtins.input', side_effect=['/report', 'n', 'p', 'n', '39']):
+            with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                index = self.task_manager.select_task('edit')
+        output = fake_out.getvalue()
+        self.assertEqual(index, 38)
+        self.assertIn("Matches 11-20 for 'report':", output)
+        self.assertIn("Name: Report 39\n", output)
+        self.assertEqual(output.count("Matches 1-10 for 'report':"), 2)
+
+    def test_select_task_jump_on_single_page(self):
+        """Test that g<page> works when the task list fits on one page."""
+        self.task_manager.tasks.append({
+            "task_name": "Only Task",
+            "task_due_date": "2023-12-31",
+            "task_description": "Single page",
+            "priority_level": 5,
+            "status": "To be started"
+        })
+        with patch('builtins.input', side_effect=['g1', '1']):
+            with patch('builtins.print') as mock_print:
+                index = self.task_manager.select_task('delete')
+        self.assertEqual(index, 0)
+        self.assertNotIn(unittest.mock.call("Please enter a valid task number."), mock_print.call_args_list)
+
+    def test_page_size_must_be_positive(self):
+        """Test that TaskManager rejects a page size below 1."""
+        with self.assertRaises(ValueError):
+            TaskManager(task_file=self.test_task_file, page_size=0)
+
+    def test_save_and_restore_snapshot(self):
+        """Test restoring a snapshot taken before an add and an edit, and going forward again."""
+        with patch('builtins.print'):
+            self.task_manager.save_snapshot('empty')
+            with patch('builtins.input', side_effect=['Snapshot Task', '2024-01-01', '', '4', '1']):
+                self.task_manager.add_task()
+            with patch('builtins.input', side_effect=['1', 'Renamed Task', '', '', '', '3']):
+                self.task_manager.edit_task()
+            self.task_manager.save_snapshot('edited')
+
+            self.task_manager.restore_snapshot('empty')
+            self.assertEqual(self.task_manager.tasks, [])
+            self.assertEqual(self.task_manager.load_tasks(), [])
+            self.assertEqual(self.task_manager.search_tasks('renamed', ranked=True), [])
+
+            self.task_manager.restore_snapshot('edited')
+        self.assertEqual(self.task_manager.load_tasks()[0]['task_name'], "Renamed Task")
+        self.assertEqual(self.task_manager.tasks[0]['status'], "Finished")
+        self.assertEqual(len(self.task_manager.search_tasks('renamed', ranked=True)), 1)
+
+        with patch('builtins.print') as mock_print:
+            self.task_manager.restore_snapshot('missing')
+            mock_print.assert_called_with("No snapshot named 'missing'.")
+
+    def test_restore_snapshot_events_match_each_step(self):
+        """Test that a snapshot restore publishes events describing each step as it happened."""
+        with patch('builtins.print'):
+            with patch('builtins.input', side_effect=['A', '2024-01-01', '', '4', '1']):
+                self.task_manager.add_task()
+            with patch('builtins.input', side_effect=['1', 'B', '', '', '', '']):
+                self.task_manager.edit_task()
+            self.task_manager.save_snapshot('later')
+            self.task_manager.undo()
+            self.task_manager.undo()
+
+            events = []
+            self.task_manager.change_feed.subscribe(events.append)
+            self.task_manager.restore_snapshot('later')
+
+        self.assertEqual([event['type'] for event in events], ['created', 'updated'])
+        self.assertEqual(events[0]['after']['task_name'], "A")
+        self.assertEqual(events[1]['before'], {"task_name": "A"})
+        self.assertEqual(events[1]['after'], {"task_name": "B"})
+
+    def test_change_feed_publishes_after_save(self):
+        """Test that events go out after the save and a failing subscriber does not abort the change."""
+        saved_names = []
+
+        def check_saved(event):
+            saved_names.extend(task['task_name'] for task in self.task_manager.load_tasks())
+            raise RuntimeError("consumer down")
+
+        self.task_manager.change_feed.subscribe(check_saved)
+        with patch('builtins.print'):
+            with patch('builtins.input', side_effect=['Saved Task', '2024-01-01', '', '4', '1']):
+                self.task_manager.add_task()
+        self.assertEqual(saved_names, ["Saved Task"])
+        self.assertEqual(len(self.task_manager.search_tasks('saved', ranked=True)), 1)
+
+        events = []
+        self.task_manager.change_feed.subscribe(events.append)
+        with patch.object(self.task_manager, 'save_tasks', return_value=False):
+            with patch('builtins.print'):
+                self.task_manager.undo()
+        self.assertEqual(events, [])
+
     # New tests for filter_tasks method
     def test_filter_tasks_by_status(self):
         """Test filter_tasks method filtering by status."""